@@ -6,9 +6,11 @@ min_version = "1.0.5"
 if parse_version(__version__) < parse_version(min_version):
     raise ImportError(f"python-domino>={min_version} is required, {__version__} is installed")
 
+from ._async import AsyncEnvironmentManager
 from ._environments import Environment, EnvironmentManager, ImageType, ClusterType, Visibility
 
 __all__ = [
+    "AsyncEnvironmentManager",
     "Environment",
     "EnvironmentManager",
     "ImageType",
@@ -0,0 +1,90 @@
+import asyncio
+from typing import List
+
+from ._environments import Environment, EnvironmentManager
+
+
+class AsyncEnvironmentManager:
+    """asyncio interface to an EnvironmentManager.
+
+    Each call runs in a worker thread over the wrapped manager's pooled session and
+    shares its caches, so many lookups can be awaited together with asyncio.gather.
+    """
+
+    def __init__(self, environment_manager: EnvironmentManager):
+        """
+        Args:
+            environment_manager: The synchronous manager to issue requests with.
+                Use AsyncEnvironmentManager.create to build one without blocking the event loop.
+        """
+        self.environment_manager = environment_manager
+
+    @classmethod
+    async def create(cls, host=None, api_key=None, domino_token_file=None) -> "AsyncEnvironmentManager":
+        """Create the underlying EnvironmentManager in a worker thread.
+
+        Arguments are the same as EnvironmentManager's.
+        """
+        environment_manager = await asyncio.to_thread(EnvironmentManager, host, api_key, domino_token_file)
+        return cls(environment_manager)
+
+    def close(self):
+        self.environment_manager.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def refresh_defaults(self, force: bool = False):
+        await asyncio.to_thread(self.environment_manager.refresh_defaults, force)
+
+    async def get_default_environment(self, force: bool = False) -> Environment:
+        return await asyncio.to_thread(self.environment_manager.get_default_environment, force)
+
+    async def get_environment(self, environment_id: str) -> Environment:
+        return await asyncio.to_thread(self.environment_manager.get_environment, environment_id)
+
+    async def get_environments(self, environment_ids: List[str]) -> List[Environment]:
+        """Retrieve several environments concurrently, in the same order as environment_ids."""
+        return list(await asyncio.gather(*(self.get_environment(i) for i in environment_ids)))
+
+    async def get_revision_details(self, environment: Environment, revision_id: str = None) -> dict:
+        return await asyncio.to_thread(self.environment_manager.get_revision_details, environment, revision_id)
+
+    async def deployment_version(self) -> str:
+        return await asyncio.to_thread(self.environment_manager.deployment_version)
+
+    async def get_environments_list(self) -> list:
+        return await asyncio.to_thread(self.environment_manager.get_environments_list)
+
+    async def archive_environment(self, environment: Environment):
+        return await asyncio.to_thread(self.environment_manager.archive_environment, environment)
+
+    async def create_environment(self, *args, **kwargs):
+        """Arguments are the same as EnvironmentManager.create_environment."""
+        return await asyncio.to_thread(self.environment_manager.create_environment, *args, **kwargs)
+
+    async def create_revision(self, *args, **kwargs):
+        """Arguments are the same as EnvironmentManager.create_revision."""
+        return await asyncio.to_thread(self.environment_manager.create_revision, *args, **kwargs)
+
+    async def create_revisions_bulk(self, revision_specs: List[dict]) -> list:
+        """Create several revisions concurrently.
+
+        Returns one result per spec, in the same order as revision_specs: the response, or the
+        exception raised for that spec.
+        """
+        revisions = (self.create_revision(**spec) for spec in revision_specs)
+        return list(await asyncio.gather(*revisions, return_exceptions=True))
+
+    async def get_build_status(self, environment: Environment, revision_id: str = None):
+        return await asyncio.to_thread(self.environment_manager.get_build_status, environment, revision_id)
+
+    async def get_build_statuses(self, revisions: List[tuple]) -> list:
+        """Arguments are the same as EnvironmentManager.get_build_statuses."""
+        return await asyncio.to_thread(self.environment_manager.get_build_statuses, revisions)
+
+    async def get_build_logs(self, environment: Environment, revision_id: str = None, since: int = 0):
+        return await asyncio.to_thread(self.environment_manager.get_build_logs, environment, revision_id, since)
@@ -1,9 +1,17 @@
-import io
+import copy
 import logging
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
 from typing import List, Union
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 # python-domino version compatibility
 try:
     from domino.bearer_auth import BearerAuth
@@ -18,7 +26,69 @@ from domino.helpers import (
 from domino.http_request_manager import _HttpRequestManager
 
 from ._version import __version__
-from .utils import DominoAPIKeyAuth, list_to_string, parse_revision_tar
+from .utils import (
+    DominoAPIKeyAuth,
+    LRUCache,
+    encode_form_payload,
+    json_loads,
+    list_to_string,
+    parse_revision_tar,
+)
+
+# Connection pool sizing for the single Domino host every manager talks to
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+# The last 5xx response is returned rather than raised, so it still reaches python-domino's
+# raise_for_status handling, and Retry-After is ignored so a server cannot stall a call with it
+MAX_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+# Upper bound on concurrent requests issued by the bulk helpers, kept within the pool size
+MAX_WORKERS = 8
+
+# Shared, read-only headers for the form posts, requests copies them into each request
+FORM_HEADERS = MappingProxyType({"Content-Type": "application/x-www-form-urlencoded"})
+
+# Log lines in the HTML returned by the build logs endpoint, matched on the raw bytes.
+# A line may itself contain newlines.
+BUILD_LOG_LINE_RE = re.compile(rb'<td class="line"[^>]*>(.*?)</td>', re.DOTALL)
+
+# Number of revisions requested per revision summary page
+REVISION_PAGE_SIZE = 500
+# Upper bound on the revision summary pages searched for a single revision
+REVISION_SUMMARY_MAX_PAGES = 100
+
+# Seconds a fetched default environment is reused before it is requested again
+DEFAULT_ENVIRONMENT_TTL = 300
+
+# Number of parsed revisions kept in memory
+REVISION_CACHE_SIZE = 128
+
+# Number of build logs kept by each manager
+BUILD_LOG_CACHE_SIZE = 64
+
+# Process-wide caches. The deployment version is shared by every manager talking to the same host,
+# responses that need authorization are only shared by managers using the same host and credentials.
+_deployment_versions = {}
+_default_environments = {}
+# Revisions are immutable, so parsed details are cached by (*cache scope, environment_id, revision_id)
+_revision_details = LRUCache(maxsize=REVISION_CACHE_SIZE)
+
+_logger = logging.getLogger(__name__)
+_logging_configured = False
+
+
+def _configure_logging_once():
+    """Apply the DOMINO_LOG_LEVEL logging configuration the first time a manager is created."""
+    global _logging_configured
+    if not _logging_configured:
+        logging_level = logging.getLevelName(os.getenv(DOMINO_LOG_LEVEL_KEY_NAME, "INFO").upper())
+        logging.basicConfig(level=logging_level)
+        _logging_configured = True
 
 
 class ImageType:
@@ -40,44 +110,54 @@ class Visibility:
 
 
 class _EnvironmentRoutes:
+    __slots__ = (
+        "host",
+        "_environments_url",
+        "_environments_v1_url",
+        "_environments_v4_url",
+        "_deployment_version_url",
+        "_environment_default_url",
+    )
+
     def __init__(self, host: str):
         self.host = host
+        # URL prefixes shared by the routes below, built once per host
+        self._environments_url = host + "/environments"
+        self._environments_v1_url = host + "/v1/environments"
+        self._environments_v4_url = host + "/v4/environments"
+        # Routes that never vary are built outright
+        self._deployment_version_url = host + "/version"
+        self._environment_default_url = self._environments_v4_url + "/defaultEnvironment"
 
     def deployment_version(self):
-        return self.host + "/version"
+        return self._deployment_version_url
 
     def environments_list(self):
-        return self.host + "/v1/environments"
-
-    def _build_environments_url(self) -> str:
-        return self.host + "/v4/environments"
+        return self._environments_v1_url
 
     def environment_default_get(self):
-        return self._build_environments_url() + "/defaultEnvironment"
+        return self._environment_default_url
 
     def environment_create(self):
-        return self.host + "/environments"
+        return self._environments_url
 
     def environment_get(self, environment_id):
-        return self._build_environments_url() + f"/{environment_id}"
+        return f"{self._environments_v4_url}/{environment_id}"
 
     def environment_remove(self, environment_id):
-        return self._build_environments_url() + f"/{environment_id}/archive"
+        return f"{self._environments_v4_url}/{environment_id}/archive"
 
     def revision_create(self, environment_id):
-        return self.host + f"/environments/{environment_id}/revisions"
+        return f"{self._environments_url}/{environment_id}/revisions"
 
     def revision_download(self, environment_id, revision_id):
         return (
-            self.host
-            + f"/v1/environments/{environment_id}/revisions/{revision_id}/dockerImageSourceProjectWeb"
+            f"{self._environments_v1_url}/{environment_id}"
+            f"/revisions/{revision_id}/dockerImageSourceProjectWeb"
         )
 
     def revision_summaries(self, environment_id, pageStart, pageEnd):
-        return (
-            self.host
-            + f"/environments/{environment_id}/json/paged/{pageStart}/{pageEnd}"
-        )
+        return f"{self._environments_url}/{environment_id}/json/paged/{pageStart}/{pageEnd}"
 
     def build_logs(self, build_logs_url: str):
         return (
@@ -85,38 +165,48 @@ class _EnvironmentRoutes:
         )
 
 class Environment:
+    """Read-only snapshot of an environment as returned by the Domino API.
+
+    Properties are computed on first access and cached, so the object does not
+    reflect later server-side changes. Use EnvironmentManager.get_environment to
+    fetch a fresh copy.
+    """
+
+    # __dict__ holds the cached_property values
+    __slots__ = ("_data", "__dict__")
+
     def __init__(self, data: dict):
         self._data = data
 
-    @property
+    @cached_property
     def id(self) -> str:
         return self._data.get("id")
 
-    @property
+    @cached_property
     def latest_revision(self) -> dict:
         return self._data.get("latestRevision")
 
-    @property
+    @cached_property
     def active_revision(self) -> dict:
         return self._data.get("selectedRevision")
 
-    @property
+    @cached_property
     def archived(self) -> bool:
         return self._data.get("archived")
 
-    @property
+    @cached_property
     def name(self) -> str:
         return self._data.get("name")
 
-    @property
+    @cached_property
     def visibility(self) -> str:
         return self._data.get("visibility")
 
-    @property
+    @cached_property
     def owner(self) -> dict:
         return self._data.get("owner")
 
-    @property
+    @cached_property
     def supported_clusters(self) -> list:
         return self._data.get("supportedClusters")
 
@@ -124,6 +214,12 @@ class Environment:
 class EnvironmentManager:
     _default_environment: Environment
     _default_details: dict
+    _default_revision_id: str
+    _default_base_image: str
+
+    # Shared managers handed out by get_instance, keyed by host and credentials
+    _instances = {}
+    _instances_lock = threading.Lock()
 
     def __init__(self, host=None, api_key=None, domino_token_file=None):
         """
@@ -138,7 +234,7 @@ class EnvironmentManager:
                 If not provided the library will expect to find one in the
                 DOMINO_TOKEN_FILE environment variable.
         """
-        self._configure_logging()
+        _configure_logging_once()
 
         _host = host or os.getenv(DOMINO_HOST_KEY_NAME)
         if not _host:
@@ -153,6 +249,10 @@ class EnvironmentManager:
 
         self.request_manager = self._initialise_request_manager(api_key, domino_token_file)
         self._routes = _EnvironmentRoutes(host)
+        # Cached responses are never handed to a manager authenticating as someone else
+        self._cache_scope = (host, api_key, domino_token_file)
+        # Build logs by URL as (ETag, lines)
+        self._build_logs = LRUCache(maxsize=BUILD_LOG_CACHE_SIZE)
 
         # Get Domino deployment version
         self._version = self.deployment_version()
@@ -169,18 +269,43 @@ class EnvironmentManager:
 
         self.refresh_defaults()
 
+    @classmethod
+    def get_instance(cls, host=None, api_key=None, domino_token_file=None) -> "EnvironmentManager":
+        """Return a manager shared by every caller using the same host and credentials.
+
+        Arguments are the same as the constructor's, including the environment variable fallbacks.
+        """
+        host = host or os.getenv(DOMINO_HOST_KEY_NAME)
+        key = (
+            # The same host written differently, e.g. with a trailing slash, shares one manager
+            clean_host_url(host) if host else host,
+            api_key or os.getenv(DOMINO_USER_API_KEY_KEY_NAME),
+            domino_token_file or os.getenv(DOMINO_TOKEN_FILE_KEY_NAME),
+        )
+        # Held while the manager is created, so concurrent first calls do not each build one
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(host, api_key, domino_token_file)
+                cls._instances[key] = instance
+        return instance
+
+    def close(self):
+        """Close the pooled connections held by this manager."""
+        # python-domino version compatibility
+        session = getattr(self.request_manager, "request_session", None)
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     @property
     def log(self):
-        try:
-            return self._logger
-        except AttributeError:
-            self._configure_logging()
-            return self._logger
-
-    def _configure_logging(self):
-        logging_level = logging.getLevelName(os.getenv(DOMINO_LOG_LEVEL_KEY_NAME, "INFO").upper())
-        logging.basicConfig(level=logging_level)
-        self._logger = logging.getLogger(__name__)
+        return _logger
 
     def _initialise_request_manager(self, api_key: str, domino_token_file: str):
         if api_key is None and domino_token_file is None:
@@ -190,28 +315,107 @@ class EnvironmentManager:
             )
         elif domino_token_file is not None:
             self.log.info("Initializing python-domino-environments with bearer token auth")
-            return _HttpRequestManager(BearerAuth(domino_token_file))
+            request_manager = _HttpRequestManager(BearerAuth(domino_token_file))
         else:
             self.log.info("Fallback: Initializing python-domino-environments with API key auth")
-            return _HttpRequestManager(DominoAPIKeyAuth(api_key))
+            request_manager = _HttpRequestManager(DominoAPIKeyAuth(api_key))
+
+        self._mount_pooled_adapter(request_manager)
+        return request_manager
+
+    def _mount_pooled_adapter(self, request_manager):
+        """Reuse keep-alive connections to the Domino host across every request made by this manager."""
+        # python-domino version compatibility
+        session = getattr(request_manager, "request_session", None)
+        if session is None:
+            self.log.debug("python-domino request manager has no session, connection pooling disabled")
+            return
+
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=MAX_RETRIES,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def _get_json(self, url: str):
+        return json_loads(self.request_manager.get(url).content)
 
     def deployment_version(self):
-        url = self._routes.deployment_version()
-        return self.request_manager.get(url).json().get("version")
+        host = self._routes.host
+        version = _deployment_versions.get(host)
+        if version is None:
+            url = self._routes.deployment_version()
+            version = self._get_json(url).get("version")
+            _deployment_versions[host] = version
+        return version
+
+    def refresh_defaults(self, force: bool = False):
+        """Load the environments list, the default environment and its revision details.
 
-    def refresh_defaults(self):
-        self._environments_list = self.get_environments_list()
-        self._default_environment = self.get_default_environment()
-        self._default_details = self.get_revision_details(self._default_environment)
+        Args:
+            force: Revalidate the default environment with the server even if the cached copy is fresh.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The environments list is independent of the default environment lookups below
+            environments_list = executor.submit(self.get_environments_list)
+
+            self._default_environment = self.get_default_environment(force=force)
+            self._default_details = self.get_revision_details(self._default_environment)
+            # Bases used by create_environment and create_revision when none is given
+            self._default_revision_id = self._default_environment.active_revision["id"]
+            # A default revision without a readable Dockerfile must not stop the manager from being created
+            self._default_base_image = self._default_details.get("Dockerfile", {}).get("base_image")
+            self._environments_list = environments_list.result()
+
+    def invalidate_caches(self):
+        """Forget the cached deployment version and default environment for this host.
+
+        Revision details are immutable and stay cached.
+        """
+        _deployment_versions.pop(self._routes.host, None)
+        _default_environments.pop(self._cache_scope, None)
 
     def get_environments_list(self):
         url = self._routes.environments_list()
-        return self.request_manager.get(url).json().get('data')
+        return self._get_json(url).get('data')
+
+    def get_default_environment(self, force: bool = False) -> Environment:
+        """Retrieve the default environment, reusing the copy cached for this host and credentials while it is fresh.
+
+        Args:
+            force: Revalidate with the server even if the cached copy is fresh.
+        """
+        cached = _default_environments.get(self._cache_scope)
+        if not force and cached is not None and time.monotonic() - cached[0] < DEFAULT_ENVIRONMENT_TTL:
+            return cached[1]
 
-    def get_default_environment(self) -> Environment:
         url = self._routes.environment_default_get()
-        data = self.request_manager.get(url).json()
-        return Environment(data)
+        headers = {}
+        etag = last_modified = None
+        if cached is not None:
+            # Revalidate the expired entry, an unchanged default comes back as an empty 304
+            etag, last_modified = cached[2], cached[3]
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self.request_manager.get(url, headers=headers)
+        if response.status_code == 304:
+            environment = cached[1]
+            # A 304 may omit the validators, the stored ones still describe the cached body
+            etag = response.headers.get("ETag", etag)
+            last_modified = response.headers.get("Last-Modified", last_modified)
+        else:
+            environment = Environment(json_loads(response.content))
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        # Environments are read-only, so the parsed object itself is shared between managers
+        _default_environments[self._cache_scope] = (time.monotonic(), environment, etag, last_modified)
+        return environment
 
     def archive_environment(self, environment: Environment):
         url = self._routes.environment_remove(environment.id)
@@ -219,9 +423,24 @@ class EnvironmentManager:
 
     def get_environment(self, environment_id: str) -> Environment:
         url = self._routes.environment_get(environment_id)
-        data = self.request_manager.get(url).json()
+        data = self._get_json(url)
         return Environment(data)
 
+    def get_environments(self, environment_ids: List[str]) -> List[Environment]:
+        """Retrieve several environments concurrently.
+
+        Args:
+            environment_ids: The IDs of the environments, results are returned in the same order.
+        """
+        # Each distinct ID is requested once, however often it is repeated
+        unique_ids = list(dict.fromkeys(environment_ids))
+        if not unique_ids:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(unique_ids))) as executor:
+            environments = dict(zip(unique_ids, executor.map(self.get_environment, unique_ids)))
+        return [environments[environment_id] for environment_id in environment_ids]
+
     def create_environment(
         self,
         name: str,
@@ -236,10 +455,10 @@ class EnvironmentManager:
         cluster_types: str = None,
     ):
         if not base_environment_revision_id:
-            base_environment_revision_id = self._default_environment.active_revision["id"]
+            base_environment_revision_id = self._default_revision_id
 
         if not base_default_environment_image:
-            base_default_environment_image = self._default_details["Dockerfile"]["base_image"]
+            base_default_environment_image = self._default_base_image
 
         # Ensure that the description is a string
         description = list_to_string(description)
@@ -252,21 +471,16 @@ class EnvironmentManager:
             "base.dockerImage": docker_image,
             "base.baseEnvironmentRevisionId": base_environment_revision_id,
             "base.defaultEnvironmentImage": base_default_environment_image,
+            # Optional fields are left as None, which encode_form_payload omits
+            "organizationOwnerId": organization_owner_id if visibility == Visibility.ORGANIZATION else None,
+            "userOwnerId": user_owner_id or None,
+            "clusterTypes[]": cluster_types or None,
         }
 
-        if visibility == Visibility.ORGANIZATION:
-            form_payload["organizationOwnerId"] = organization_owner_id
-
-        if user_owner_id:
-            form_payload["userOwnerId"] = user_owner_id
-
-        if cluster_types:
-            form_payload["clusterTypes[]"] = cluster_types
-
         response = self.request_manager.post(
             url=self._routes.environment_create(),
-            data=form_payload,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=encode_form_payload(form_payload),
+            headers=FORM_HEADERS,
         )
         if response.ok:
             env_id = response.url.split("/")[-1]
@@ -309,60 +523,66 @@ class EnvironmentManager:
         summary: str = "",
     ):
         if not base_environment_revision_id:
-            base_environment_revision_id = self._default_environment.active_revision["id"]
+            base_environment_revision_id = self._default_revision_id
 
         if not base_default_environment_image:
-            base_default_environment_image = self._default_details["Dockerfile"]["base_image"]
-
-        # Ensure that each variable is a single string
-        dockerfile_instructions = list_to_string(dockerfile_instructions)
-        workspace_tools = list_to_string(workspace_tools)
-        pre_run_script = list_to_string(pre_run_script)
-        post_run_script = list_to_string(post_run_script)
-        pre_setup_script = list_to_string(pre_setup_script)
-        post_setup_script = list_to_string(post_setup_script)
-        docker_arguments = list_to_string(docker_arguments)
+            base_default_environment_image = self._default_base_image
 
         form_payload = {
             "base.imageType": image_type,
             "base.dockerImage": docker_image,
             "base.baseEnvironmentRevisionId": base_environment_revision_id,
             "base.defaultEnvironmentImage": base_default_environment_image,
-            "dockerfileInstructions": dockerfile_instructions,
-            "properties": workspace_tools,
-            "preRunScript": pre_run_script,
-            "postRunScript": post_run_script,
-            "preSetupScript": pre_setup_script,
-            "postSetupScript": post_setup_script,
-            "dockerArguments": docker_arguments,
+            # Ensure that each of these variables is a single string
+            "dockerfileInstructions": list_to_string(dockerfile_instructions),
+            "properties": list_to_string(workspace_tools),
+            "preRunScript": list_to_string(pre_run_script),
+            "postRunScript": list_to_string(post_run_script),
+            "preSetupScript": list_to_string(pre_setup_script),
+            "postSetupScript": list_to_string(post_setup_script),
+            "dockerArguments": list_to_string(docker_arguments),
             "summary": summary,
+            # Optional fields are left as None, which encode_form_payload omits
+            "noCache": True if force_rebuild else None,
+            "shouldUseVPN": "on" if should_use_vpn else None,
+            "clusterTypes[]": cluster_types or None,
         }
 
+        environment_variable_fields = []
         if environment_variables:
             if isinstance(environment_variables, dict):
                 # Convert dictionary to a list of tuples
                 environment_variables = list(environment_variables.items())
 
-            for idx, (key, val) in enumerate(environment_variables):
-                form_payload[f"buildEnvironmentVariables[{idx}].name"] = key
-                form_payload[f"buildEnvironmentVariables[{idx}].value"] = val
-
-        if force_rebuild:
-            form_payload["noCache"] = True
-
-        if should_use_vpn:
-            form_payload["shouldUseVPN"] = "on"
-
-        if cluster_types:
-            form_payload["clusterTypes[]"] = cluster_types
+            environment_variable_fields = [
+                (f"buildEnvironmentVariables[{idx}].{field}", value)
+                for idx, (key, val) in enumerate(environment_variables)
+                for field, value in (("name", key), ("value", val))
+            ]
 
         return self.request_manager.post(
             url=self._routes.revision_create(environment.id),
-            data=form_payload,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=encode_form_payload(form_payload, environment_variable_fields),
+            headers=FORM_HEADERS,
         )
 
-    #TODO: add some paging logic in here. search 10/20 at a time and fail if not found
+    def create_revisions_bulk(self, revision_specs: List[dict]) -> list:
+        """Create several revisions concurrently.
+
+        Args:
+            revision_specs: Keyword arguments for each create_revision call.
+
+        Returns one result per spec, in the same order: the response, or the exception raised
+        for that spec. A failed spec does not stop the others, and revisions that were created
+        can be told apart from failed ones without retrying the whole batch.
+        """
+        if not revision_specs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(revision_specs))) as executor:
+            futures = [executor.submit(self.create_revision, **spec) for spec in revision_specs]
+        return [future.exception() or future.result() for future in futures]
+
     def get_build_status(self, environment: Environment, revision_id: str = None):
         """Gather current status of build job for a given environment/revision
 
@@ -371,38 +591,129 @@ class EnvironmentManager:
             revision_id: The ID of the revision, defaults to the environment's latest revision.
         """
         revision_id = revision_id or environment.latest_revision.get("id")
-        summary = self._get_revision_summary(environment.id)
+        summary = self._find_revision_summary(environment.id, revision_id)
         return summary['buildStatus'][revision_id]
 
-    def get_build_logs(self, environment: Environment, revision_id: str = None):
+    def get_build_statuses(self, revisions: List[tuple]) -> list:
+        """Gather build statuses of several environment/revision pairs concurrently
+
+        Args:
+            revisions: (environment, revision_id) pairs, a revision_id of None selects the
+                environment's latest revision. Statuses are returned in the same order.
+        """
+        revisions = [
+            (environment.id, revision_id or environment.latest_revision.get("id"))
+            for environment, revision_id in revisions
+        ]
+        if not revisions:
+            return []
+
+        # One summary lookup per environment, the page found usually lists its other revisions too
+        requested = {}
+        for environment_id, revision_id in revisions:
+            requested.setdefault(environment_id, []).append(revision_id)
+
+        # Environments and their older pages share MAX_WORKERS, so the nested searches never
+        # open more concurrent requests than the connection pool is sized for
+        environment_workers = min(MAX_WORKERS, len(requested))
+        page_workers = MAX_WORKERS // environment_workers
+
+        def environment_statuses(environment_id):
+            statuses = {}
+            for revision_id in requested[environment_id]:
+                if revision_id not in statuses:
+                    summary = self._find_revision_summary(environment_id, revision_id, page_workers)
+                    statuses.update(summary['buildStatus'])
+            return statuses
+
+        with ThreadPoolExecutor(max_workers=environment_workers) as executor:
+            statuses = dict(zip(requested, executor.map(environment_statuses, requested)))
+        return [statuses[environment_id][revision_id] for environment_id, revision_id in revisions]
+
+    def get_build_logs(self, environment: Environment, revision_id: str = None, since: int = 0):
         """Gather logs of build job for a given environment/revision
 
         Args:
             environment: The environment object.
             revision_id: The ID of the revision, defaults to the environment's latest revision.
+            since: Number of leading lines to skip. When polling a running build, pass the number of
+                lines already received to get only the new ones.
         """
         revision_id = revision_id or environment.latest_revision.get("id")
-        summary = self._get_revision_summary(environment.id)
+        summary = self._find_revision_summary(environment.id, revision_id)
         logs_url = summary['buildLogsUrl'][revision_id]
 
         url = self._routes.build_logs(logs_url)
-        res = self.request_manager.get(url)
-
-        regex = re.compile((r'<td class="line".*?>(.*)</td>'))
-        logs_matching = regex.findall(res.text)
+        cached = self._build_logs.get(url)
+        headers = {}
+        if cached is not None:
+            # Unchanged logs come back as an empty 304
+            headers["If-None-Match"] = cached[0]
+        res = self.request_manager.get(url, headers=headers)
+
+        if res.status_code == 304:
+            logs_matching = list(cached[1])
+        else:
+            logs_matching = [line.decode("utf-8", "replace") for line in BUILD_LOG_LINE_RE.findall(res.content)]
+            etag = res.headers.get("ETag")
+            if etag:
+                self._build_logs.set(url, (etag, tuple(logs_matching)))
 
-        return logs_matching
+        return logs_matching[since:]
 
 
 
     def _scrape_revision(self, environment_id: str, revision_id: str) -> dict:
-        url = self._routes.revision_download(environment_id, revision_id)
-        res = self.request_manager.get(url)
-        file_io = io.BytesIO(res.content)
-        return parse_revision_tar(file_io)
+        key = (*self._cache_scope, environment_id, revision_id)
+        content = _revision_details.get(key)
+        if content is None:
+            url = self._routes.revision_download(environment_id, revision_id)
+            # Parse the tar as it arrives instead of buffering the whole body first
+            with self.request_manager.get(url, stream=True) as res:
+                res.raw.decode_content = True
+                content = parse_revision_tar(res.raw)
+            _revision_details.set(key, content)
 
+        # Callers get their own copy, so changes made to it never reach the cached details
+        return copy.deepcopy(content)
 
-    def _get_revision_summary(self, environment_id: str, pageStart=0, pageEnd=500) -> dict:
+
+    def _get_revision_summary(self, environment_id: str, pageStart=0, pageEnd=REVISION_PAGE_SIZE) -> dict:
         url = self._routes.revision_summaries(environment_id, pageStart, pageEnd)
-        res = self.request_manager.get(url)
-        return res.json()
+        return self._get_json(url)
+
+    def _find_revision_summary(self, environment_id: str, revision_id: str, max_workers: int = MAX_WORKERS) -> dict:
+        """Return the revision summary page that lists revision_id.
+
+        The first page holds the most recent revisions and is fetched on its own. Older pages
+        are then fetched concurrently, max_workers at a time, until the revision is found, a
+        page comes back short, a batch lists no revision that was not seen before, or
+        REVISION_SUMMARY_MAX_PAGES pages have been searched. KeyError is raised when the
+        revision is not found.
+        """
+        pages = [self._get_revision_summary(environment_id, 0, REVISION_PAGE_SIZE)]
+        page_start = REVISION_PAGE_SIZE
+        last_page_end = REVISION_SUMMARY_MAX_PAGES * REVISION_PAGE_SIZE
+        seen_revisions = set()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                for page in pages:
+                    if revision_id in page.get("buildStatus", {}):
+                        return page
+                if any(len(page.get("buildStatus", {})) < REVISION_PAGE_SIZE for page in pages):
+                    raise KeyError(revision_id)
+
+                # Stop if the endpoint ignores the page bounds and keeps repeating the same revisions
+                batch_revisions = set().union(*(page.get("buildStatus", {}) for page in pages))
+                if batch_revisions <= seen_revisions or page_start >= last_page_end:
+                    raise KeyError(revision_id)
+                seen_revisions |= batch_revisions
+
+                batch_end = min(page_start + max_workers * REVISION_PAGE_SIZE, last_page_end)
+                page_starts = range(page_start, batch_end, REVISION_PAGE_SIZE)
+                pages = list(executor.map(
+                    lambda start: self._get_revision_summary(environment_id, start, start + REVISION_PAGE_SIZE),
+                    page_starts,
+                ))
+                page_start = batch_end
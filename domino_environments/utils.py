@@ -1,15 +1,24 @@
-import io
-import tarfile
-from typing import IO, List
+import threading
+from collections import OrderedDict
+from itertools import chain
+from typing import IO, Any, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
 
 from requests.auth import AuthBase
 
+# orjson decodes response bytes directly and is noticeably faster, use it when available
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 class DominoAPIKeyAuth(AuthBase):
     """Attaches Domino API Key Header to the given Request object."""
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        self._headers = {"X-Domino-Api-Key": api_key}
 
     def __eq__(self, other):
         return self.api_key == getattr(other, "api_key", None)
@@ -18,34 +27,86 @@ class DominoAPIKeyAuth(AuthBase):
         return not self == other
 
     def __call__(self, r):
-        r.headers["X-Domino-Api-Key"] = self.api_key
+        r.headers.update(self._headers)
         return r
 
 
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry beyond maxsize."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 def parse_version(version, sep="."):
     """Convert string version into a tuple of ints for easy comparisons."""
     return tuple(int(x) for x in version.split(sep))
 
 
 def list_to_string(val, separator="\n"):
-    if isinstance(val, list):
+    """Join a list of lines into a single string, strings are returned as is and None becomes ""."""
+    # Exact type checks keep the common plain string case cheap
+    val_type = type(val)
+    if val_type is str:
+        return val
+    if val_type is list:
         return separator.join(val)
-    return val
+    return val if val is not None else ""
+
+
+def encode_form_payload(payload: dict, extra_fields: Iterable[Tuple[str, Any]] = ()) -> str:
+    """URL-encode a form payload and any extra (key, value) pairs in one call.
+
+    None values are skipped the way requests does.
+    """
+    fields = [(key, val) for key, val in chain(payload.items(), extra_fields) if val is not None]
+    return urlencode(fields, doseq=True)
 
 
-def parse_plain_text(file_obj, encoding="utf-8") -> List[str]:
+def parse_plain_text(file_obj: Optional[IO[bytes]], encoding="utf-8") -> List[str]:
     lines = []
-    if isinstance(file_obj, io.BufferedReader):
+    # tarfile hands back None for members that are not regular files
+    if file_obj is not None:
         file_content = file_obj.read().decode(encoding)
         lines = file_content.splitlines()
     return lines
 
 
-def parse_dockerfile(file_obj) -> dict:
+def parse_base_image(from_line: str) -> str:
+    """Return the image named by a Dockerfile FROM instruction."""
+    line = from_line.strip()
+    return line[5:].strip() if line.startswith("FROM ") else line
+
+
+def parse_dockerfile(file_obj: Optional[IO[bytes]]) -> dict:
     content = dict()
-    if isinstance(file_obj, io.BufferedReader):
+    if file_obj is not None:
         lines = parse_plain_text(file_obj)
-        content["base_image"] = lines[0].strip("FROM ")
+        content["base_image"] = parse_base_image(lines[0])
         content["instructions"] = lines[2:-2]  # Cut out the Domino specific instructions
     return content
 
@@ -57,16 +118,26 @@ REVISION_PARSERS = {
     "preRunScript.sh": parse_plain_text,
     "postRunScript.sh": parse_plain_text,
 }
+REVISION_FILE_NAMES = frozenset(REVISION_PARSERS)
 
 
 def parse_revision_tar(file_obj: IO[bytes]) -> dict:
+    import tarfile
+
     content = dict()
-    tar = tarfile.open(fileobj=file_obj)
-    for member in tar.getmembers():
-        file_name = member.name.split("/")[-1]
-        parse_func = REVISION_PARSERS.get(file_name)
-        if parse_func:
-            extracted_file = tar.extractfile(member.name)
-            content[file_name] = parse_func(extracted_file)
+    # Stream mode reads the archive in a single forward pass and never seeks
+    with tarfile.open(fileobj=file_obj, mode="r|*") as tar:
+        for member in tar:
+            # Directories, links and members the scraper does not parse are skipped without reading their data
+            if not member.isfile():
+                continue
+            file_name = member.name.rpartition("/")[2]
+            if file_name not in REVISION_FILE_NAMES:
+                continue
+            extracted_file = tar.extractfile(member)
+            content[file_name] = REVISION_PARSERS[file_name](extracted_file)
+            if len(content) == len(REVISION_FILE_NAMES):
+                # Everything the scraper needs has been read, leave the rest of the archive unread
+                break
 
     return content
@@ -1,19 +1,16 @@
-import re
-
 from setuptools import find_packages, setup
 
 
 def get_version():
     try:
-        fp = open(f"domino_environments/_version.py")
+        fp = open("domino_environments/_version.py")
     except EnvironmentError:
         return None
 
-    re_version = re.compile(r'__version__ = "([^"]+)"')
-    for line in fp.readlines():
-        match = re_version.search(line)
-        if match:
-            return match.group(1)
+    with fp:
+        for line in fp:
+            if line.startswith("__version__"):
+                return line.split('"')[1]
 
     return None
 
@@ -28,11 +25,17 @@ setup(
     version=get_version(),
     author="Domino Data Lab",
     author_email="support@dominodatalab.com",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     scripts=[],
     url="https://www.dominodatalab.com/",
     license="LICENSE",
     description="Extension on the Python bindings for the Domino API to work with environments",
     long_description="",
+    # asyncio.to_thread in the async manager needs 3.9
+    python_requires=">=3.9",
     install_requires=get_requirements(),
+    extras_require={
+        # Faster decoding of API responses, used automatically when installed
+        "fast-json": ["orjson"],
+    },
 )
@@ -0,0 +1,216 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from domino_environments import _environments
+from domino_environments._environments import BUILD_LOG_CACHE_SIZE, REVISION_PAGE_SIZE, Environment, EnvironmentManager
+from domino_environments.utils import LRUCache
+
+
+def make_manager():
+    """An EnvironmentManager that makes no requests on its own, its HTTP methods are patched per test."""
+    manager = EnvironmentManager.__new__(EnvironmentManager)
+    manager._routes = _environments._EnvironmentRoutes("https://domino.example")
+    manager._cache_scope = ("https://domino.example", "api-key", None)
+    manager.request_manager = mock.Mock()
+    manager._build_logs = LRUCache(maxsize=BUILD_LOG_CACHE_SIZE)
+    return manager
+
+
+def make_response(status_code=200, content=b"{}", headers=None):
+    return mock.Mock(status_code=status_code, content=content, headers=headers or {})
+
+
+def summary_page(start, end):
+    revisions = [f"r{i}" for i in range(start, end)]
+    return {
+        "buildStatus": {revision: "Succeeded" for revision in revisions},
+        "buildLogsUrl": {revision: f"/environments/e/revisions/{revision}/logs" for revision in revisions},
+    }
+
+
+class FindRevisionSummaryTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = make_manager()
+        self.requested = []
+
+    def paged_summaries(self, total):
+        """Summary pages of an environment with total revisions, honouring the page bounds."""
+
+        def get_revision_summary(environment_id, page_start, page_end):
+            self.requested.append(page_start)
+            return summary_page(page_start, min(page_end, total))
+
+        self.manager._get_revision_summary = get_revision_summary
+
+    def test_revision_on_first_page(self):
+        self.paged_summaries(3 * REVISION_PAGE_SIZE)
+        page = self.manager._find_revision_summary("e", "r3")
+        self.assertIn("r3", page["buildStatus"])
+        self.assertEqual(self.requested, [0])
+
+    def test_revision_on_older_page(self):
+        self.paged_summaries(3 * REVISION_PAGE_SIZE)
+        revision_id = f"r{2 * REVISION_PAGE_SIZE + 1}"
+        page = self.manager._find_revision_summary("e", revision_id)
+        self.assertIn(revision_id, page["buildStatus"])
+
+    def test_missing_revision_stops_at_short_page(self):
+        self.paged_summaries(REVISION_PAGE_SIZE + 10)
+        with self.assertRaises(KeyError):
+            self.manager._find_revision_summary("e", "missing")
+        self.assertEqual(self.requested[0], 0)
+        self.assertLessEqual(len(self.requested), 1 + _environments.MAX_WORKERS)
+
+    def test_stops_when_page_bounds_are_ignored(self):
+        def get_revision_summary(environment_id, page_start, page_end):
+            self.requested.append(page_start)
+            return summary_page(0, REVISION_PAGE_SIZE)
+
+        self.manager._get_revision_summary = get_revision_summary
+        with self.assertRaises(KeyError):
+            self.manager._find_revision_summary("e", "missing")
+        self.assertEqual(len(self.requested), 1 + _environments.MAX_WORKERS)
+
+    def test_stops_after_max_pages(self):
+        # Every page is full of new revisions, so only the page limit ends the search
+        self.paged_summaries(10 ** 9)
+        with mock.patch.object(_environments, "REVISION_SUMMARY_MAX_PAGES", 20):
+            with self.assertRaises(KeyError):
+                self.manager._find_revision_summary("e", "missing")
+        self.assertEqual(sorted(self.requested), [i * REVISION_PAGE_SIZE for i in range(20)])
+
+
+class GetBuildStatusesTest(unittest.TestCase):
+    def test_concurrent_requests_stay_within_max_workers(self):
+        manager = make_manager()
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def get_revision_summary(environment_id, page_start, page_end):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return summary_page(page_start, page_end)
+
+        manager._get_revision_summary = get_revision_summary
+        environments = [Environment({"id": f"e{i}"}) for i in range(10)]
+        # Every revision sits a few pages back, so each environment searches older pages
+        revision_id = f"r{5 * REVISION_PAGE_SIZE}"
+        statuses = manager.get_build_statuses([(environment, revision_id) for environment in environments])
+
+        self.assertEqual(statuses, ["Succeeded"] * len(environments))
+        self.assertLessEqual(peak[0], _environments.MAX_WORKERS)
+
+
+class DefaultEnvironmentTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = make_manager()
+        _environments._default_environments.clear()
+        self.addCleanup(_environments._default_environments.clear)
+
+    def sent_headers(self):
+        return self.manager.request_manager.get.call_args.kwargs["headers"]
+
+    def test_revalidates_with_stored_validators(self):
+        validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        self.manager.request_manager.get.return_value = make_response(content=b'{"id": "d1"}', headers=validators)
+        environment = self.manager.get_default_environment()
+
+        self.manager.request_manager.get.return_value = make_response(304)
+        self.assertIs(self.manager.get_default_environment(force=True), environment)
+        self.assertEqual(
+            self.sent_headers(),
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+
+        # The validators survive a 304 that does not repeat them
+        self.manager.get_default_environment(force=True)
+        self.assertEqual(self.sent_headers()["If-None-Match"], '"v1"')
+
+    def test_new_body_without_validators_drops_old_ones(self):
+        self.manager.request_manager.get.return_value = make_response(content=b'{"id": "d1"}', headers={"ETag": '"v1"'})
+        self.manager.get_default_environment()
+
+        self.manager.request_manager.get.return_value = make_response(content=b'{"id": "d2"}')
+        self.assertEqual(self.manager.get_default_environment(force=True).id, "d2")
+
+        self.manager.get_default_environment(force=True)
+        self.assertEqual(self.sent_headers(), {})
+
+
+def build_log_page(lines):
+    return "".join(f'<tr><td class="line">{line}</td></tr>' for line in lines).encode()
+
+
+class BuildLogsTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = make_manager()
+        self.manager._find_revision_summary = lambda environment_id, revision_id: summary_page(0, 3)
+        self.environment = Environment({"id": "e", "latestRevision": {"id": "r1"}})
+
+    def serve(self, lines, etag):
+        def get(url, headers):
+            if headers.get("If-None-Match") == etag:
+                return make_response(304, b"", {"ETag": etag})
+            return make_response(content=build_log_page(lines), headers={"ETag": etag})
+
+        self.manager.request_manager.get.side_effect = get
+
+    def test_since_skips_lines_already_received(self):
+        self.serve(["step 1", "step 2"], '"a"')
+        logs = self.manager.get_build_logs(self.environment)
+        self.assertEqual(logs, ["step 1", "step 2"])
+        self.assertEqual(self.manager.get_build_logs(self.environment, since=len(logs)), [])
+
+        self.serve(["step 1", "step 2", "step 3"], '"b"')
+        self.assertEqual(self.manager.get_build_logs(self.environment, since=len(logs)), ["step 3"])
+        # Each caller keeps its own offset, polling does not affect other reads
+        self.assertEqual(self.manager.get_build_logs(self.environment, since=1), ["step 2", "step 3"])
+        self.assertEqual(self.manager.get_build_logs(self.environment), ["step 1", "step 2", "step 3"])
+
+    def test_unchanged_logs_are_served_from_cache(self):
+        self.serve(["step 1"], '"a"')
+        self.manager.get_build_logs(self.environment, "r2")
+
+        logs = self.manager.get_build_logs(self.environment, "r2")
+        self.assertEqual(logs, ["step 1"])
+        self.assertEqual(self.manager.request_manager.get.call_args.kwargs["headers"], {"If-None-Match": '"a"'})
+
+        # Changing the returned list does not change the cached copy
+        logs.append("extra")
+        self.assertEqual(self.manager.get_build_logs(self.environment, "r2"), ["step 1"])
+
+    def test_cache_is_bounded(self):
+        self.serve(["step 1"], '"a"')
+        with mock.patch.object(self.manager, "_find_revision_summary") as find_revision_summary:
+            for i in range(BUILD_LOG_CACHE_SIZE + 10):
+                revision_id = f"r{i}"
+                find_revision_summary.return_value = {"buildLogsUrl": {revision_id: f"/{revision_id}/logs"}}
+                self.manager.get_build_logs(self.environment, revision_id)
+        self.assertEqual(len(self.manager._build_logs), BUILD_LOG_CACHE_SIZE)
+
+
+class CreateRevisionsBulkTest(unittest.TestCase):
+    def test_failed_spec_does_not_hide_created_revisions(self):
+        manager = make_manager()
+        error = ValueError("rejected")
+
+        def create_revision(summary):
+            if summary == "bad":
+                raise error
+            return summary
+
+        manager.create_revision = create_revision
+        results = manager.create_revisions_bulk([{"summary": "a"}, {"summary": "bad"}, {"summary": "c"}])
+        self.assertEqual(results, ["a", error, "c"])
+        self.assertEqual(manager.create_revisions_bulk([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
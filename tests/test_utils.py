@@ -0,0 +1,109 @@
+import io
+import os
+import tarfile
+import unittest
+
+from domino_environments.utils import parse_base_image, parse_revision_tar
+
+
+class ParseBaseImageTest(unittest.TestCase):
+    def test_tag_made_of_from_letters_is_kept(self):
+        self.assertEqual(parse_base_image("FROM quay.io/domino/base:ROOM"), "quay.io/domino/base:ROOM")
+
+    def test_plain_image(self):
+        self.assertEqual(parse_base_image("FROM img"), "img")
+
+    def test_surrounding_whitespace(self):
+        self.assertEqual(parse_base_image("  FROM   myregistry/foo:1.0  \n"), "myregistry/foo:1.0")
+
+    def test_line_without_from(self):
+        self.assertEqual(parse_base_image(" mongo:OFF "), "mongo:OFF")
+
+
+DOCKERFILE = b"FROM quay.io/domino/base:ROOM\nUSER root\nRUN a\nRUN b\nUSER ubuntu\nEND\n"
+REVISION_FILES = {
+    "Dockerfile": DOCKERFILE,
+    "preSetupScript.sh": b"echo pre setup",
+    "postSetupScript.sh": b"",
+    "preRunScript.sh": b"echo pre\necho run",
+    "postRunScript.sh": b"echo post",
+}
+# Random bytes do not compress, so the member stays large in the gzip archive too
+LARGE_MEMBER_SIZE = 1024 * 1024
+
+
+class CountingReader(io.RawIOBase):
+    """Readable stream without seek that records how many bytes were consumed."""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        self.consumed = 0
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        chunk = self._buffer.read(size)
+        self.consumed += len(chunk)
+        return chunk
+
+
+def add_file(tar, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def make_revision_tar(mode):
+    """Archive with a directory, an unknown member, the revision files and a large unknown member at the end."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode=mode) as tar:
+        directory = tarfile.TarInfo("project")
+        directory.type = tarfile.DIRTYPE
+        tar.addfile(directory)
+        add_file(tar, "project/context.bin", os.urandom(LARGE_MEMBER_SIZE))
+        for name, data in REVISION_FILES.items():
+            add_file(tar, f"project/{name}", data)
+        add_file(tar, "project/trailing.bin", os.urandom(LARGE_MEMBER_SIZE))
+    return buffer.getvalue()
+
+
+class ParseRevisionTarTest(unittest.TestCase):
+    expected = {
+        "Dockerfile": {"base_image": "quay.io/domino/base:ROOM", "instructions": ["RUN a", "RUN b"]},
+        "preSetupScript.sh": ["echo pre setup"],
+        "postSetupScript.sh": [],
+        "preRunScript.sh": ["echo pre", "echo run"],
+        "postRunScript.sh": ["echo post"],
+    }
+
+    def check_archive(self, mode):
+        data = make_revision_tar(mode)
+        reader = CountingReader(data)
+        self.assertEqual(parse_revision_tar(reader), self.expected)
+        # Parsing stops after the last revision file, the trailing member is never read
+        self.assertLess(reader.consumed, len(data) - LARGE_MEMBER_SIZE // 2)
+
+    def test_gzip_archive(self):
+        self.check_archive("w:gz")
+
+    def test_plain_archive(self):
+        self.check_archive("w")
+
+    def test_non_file_members_are_skipped(self):
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w") as tar:
+            directory = tarfile.TarInfo("project/Dockerfile")
+            directory.type = tarfile.DIRTYPE
+            tar.addfile(directory)
+            link = tarfile.TarInfo("project/preRunScript.sh")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "elsewhere"
+            tar.addfile(link)
+            add_file(tar, "project/postRunScript.sh", b"echo post")
+        buffer.seek(0)
+        self.assertEqual(parse_revision_tar(buffer), {"postRunScript.sh": ["echo post"]})
+
+
+if __name__ == "__main__":
+    unittest.main()